@@ -155,6 +155,7 @@ class OpenForceField(_BaseForceField):
 
     _type = 'OpenFF'
     _default_charge_method = 'am1bcc'
+    _off_forcefield = None
 
     def _get_parameters(self, molecule):
         """
@@ -174,8 +175,15 @@ def _get_parameters(self, molecule):
         from peleffy.utils.toolkits import OpenForceFieldToolkitWrapper
 
         openforcefield_toolkit = OpenForceFieldToolkitWrapper()
+
+        # The OpenFF force field is only loaded the first time, then it
+        # is reused for any subsequent parameterization
+        if self._off_forcefield is None:
+            self._off_forcefield = openforcefield_toolkit.get_forcefield(
+                self.name)
+
         parameters = openforcefield_toolkit.get_parameters_from_forcefield(
-            self.name, molecule)
+            self._off_forcefield, molecule)
 
         from peleffy.forcefield.parameters \
             import OpenForceFieldParameterWrapper
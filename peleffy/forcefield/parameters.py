@@ -264,7 +264,7 @@ def correct_type(label, value):
                 }
 
             # Skip data type transformation if the list is empty or None values
-            if value == [None,] * len(value):
+            if all(v is None for v in value):
                 return value
             if value == []:
                 return None
@@ -441,9 +441,9 @@ def zero_to_none(values):
                 if all(value == float(0.0) for value in values):
                     values = [None, ] * n_atoms
             if type(values[0]) == unit.quantity.Quantity:
-                if all(value == unit.Quantity(0, unit.angstroms) for value
-                       in values):
-                    values = values = [None, ] * n_atoms
+                zero = unit.Quantity(0, unit.angstroms)
+                if all(value == zero for value in values):
+                    values = [None, ] * n_atoms
             return values
 
         def get_phase(info):
@@ -833,7 +833,7 @@ def sigma_from_rmin_half(rmin_half):
             for idx in range(0, n_atoms):
                 params['sigmas'].append(sigma_by_idx[(idx, )])
 
-            if all([sigma is None for sigma in params['sigmas']]):
+            if all(sigma is None for sigma in params['sigmas']):
                 params['sigmas'] = list()
                 rmin_half_by_idx = build_dict(vdW_parameters, 'rmin_half')
                 for idx in range(0, n_atoms):
@@ -1130,7 +1130,7 @@ def from_ffld_output(molecule, ffld_output):
                 # In case all four k's are zero, we still need to include
                 # the proper torsion to be used by PELE in the 1-4
                 # interactions
-                if all([float(k) == 0.0 for k in fields[4:8]]):
+                if all(float(k) == 0.0 for k in fields[4:8]):
                     params['propers'].append(
                         {'atom1_idx': atom1_idx,
                          'atom2_idx': atom2_idx,
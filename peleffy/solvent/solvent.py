@@ -33,8 +33,9 @@ def __init__(self, topologies):
 
     def _initialize_dicts(self):
         """
-        It initializes empty radii and scales dictionaries. It also handles the
-        possibility of dealing with a single topology or multiple of topologies.
+        It initializes empty radii and scales lists, indexed by atom. It also
+        handles the possibility of dealing with a single topology or multiple
+        of topologies.
         """
 
         _multiple_topologies = isinstance(self.topologies, list)
@@ -42,14 +43,10 @@ def _initialize_dicts(self):
         if not _multiple_topologies:
             self._topologies = [self._topologies]
 
-        self._radii = \
-            [dict.fromkeys([tuple((idx, )) for idx in
-                            range(0, len(topology.atoms))], unit.Quantity())
-             for topology in self._topologies]
-        self._scales = \
-            [dict.fromkeys([tuple((idx, )) for idx in
-                            range(0, len(topology.atoms))], unit.Quantity())
-             for topology in self._topologies]
+        self._radii = [[unit.Quantity(), ] * len(topology.atoms)
+                       for topology in self._topologies]
+        self._scales = [[unit.Quantity(), ] * len(topology.atoms)
+                        for topology in self._topologies]
 
     @property
     def name(self):
@@ -79,24 +76,26 @@ def topologies(self):
     @property
     def radii(self):
         """
-        A list of the dicts of radii of the parameterized molecules.
+        A list of the radii of the parameterized molecules.
 
         Returns
         -------
-        radii : list[dict[atom indexes: simtk.unit.Quantity]]
-            The radius assigned to each atom of the molecule
+        radii : list[list[simtk.unit.Quantity]]
+            The radius assigned to each atom of the molecule, sorted by
+            atom index
         """
         return self._radii
 
     @property
     def scales(self):
         """
-        A list of the dicts of scales of the parameterized molecules.
+        A list of the scales of the parameterized molecules.
 
         Returns
         -------
-        scales : list[dict[atom indexes: simtk.unit.Quantity]]
-            The scale assigned to each atom of the molecule
+        scales : list[list[float]]
+            The scale assigned to each atom of the molecule, sorted by
+            atom index
         """
         return self._scales
 
@@ -133,24 +132,42 @@ def _initialize_from_topology(self):
 
         from peleffy.utils.toolkits import OpenForceFieldToolkitWrapper
 
+        # The solvent's force field is loaded only once, to get both the
+        # GBSA handler and the GBSA parameters of each molecule
         off_toolkit = OpenForceFieldToolkitWrapper()
+        off_forcefield = off_toolkit.get_forcefield(self._ff_file)
         GBSA_handler = off_toolkit.get_parameter_handler_from_forcefield(
-            'GBSA', self._ff_file)
+            'GBSA', off_forcefield)
 
         self._solvent_dielectric = GBSA_handler.solvent_dielectric
         self._solute_dielectric = GBSA_handler.solute_dielectric
         self._surface_area_penalty = GBSA_handler.surface_area_penalty
         self._solvent_radius = GBSA_handler.solvent_radius
 
-        from peleffy.forcefield import OpenForceField
+        # Strip the units that PELE expects only once
+        self._solvent_radius_value = self._solvent_radius.value_in_unit(
+            unit.angstrom)
+        self._surface_area_penalty_value = \
+            self._surface_area_penalty.value_in_unit(
+                unit.kilocalorie / (unit.angstrom**2 * unit.mole))
 
-        forcefield = OpenForceField(self._ff_file)
+        from peleffy.forcefield.parameters \
+            import OpenForceFieldParameterWrapper
 
         for idx, topology in enumerate(self.topologies):
-            parameters = forcefield.parameterize(topology.molecule,
-                                                 charge_method='dummy')
-            self._radii[idx] = parameters['GBSA_radii']
-            self._scales[idx] = parameters['GBSA_scales']
+            # Partial charges are not required to get the GBSA parameters
+            off_parameters = off_toolkit.get_parameters_from_forcefield(
+                off_forcefield, topology.molecule)
+            parameters = OpenForceFieldParameterWrapper.from_label_molecules(
+                topology.molecule, off_parameters, self._ff_file)
+
+            # OpenFF parameters are keyed by tuples of atom indexes,
+            # store them as plain lists sorted by atom index instead
+            indexes = range(0, len(topology.atoms))
+            self._radii[idx] = [parameters['GBSA_radii'][(index, )]
+                                for index in indexes]
+            self._scales[idx] = [parameters['GBSA_scales'][(index, )]
+                                 for index in indexes]
 
     def to_dict(self):
         """
@@ -170,10 +187,9 @@ def to_dict(self):
         data['SolventParameters']['General']['solute_dielectric'] = \
             round(self.solute_dielectric, 5)
         data['SolventParameters']['General']['solvent_radius'] = \
-            round(self.solvent_radius.value_in_unit(unit.angstrom), 5)
+            round(self._solvent_radius_value, 5)
         data['SolventParameters']['General']['surface_area_penalty'] = \
-            round(self.surface_area_penalty.value_in_unit(
-                unit.kilocalorie / (unit.angstrom**2 * unit.mole)), 8)
+            round(self._surface_area_penalty_value, 8)
 
         for topology, radii, scales in zip(self._topologies,
                                            self._radii, self._scales):
@@ -181,14 +197,11 @@ def to_dict(self):
 
             atom_names = topology.molecule.get_pdb_atom_names()
 
-            for atom, name in zip(topology.molecule.rdkit_molecule.GetAtoms(),
-                                  atom_names):
+            for name, radius, scale in zip(atom_names, radii, scales):
                 name = name.replace(' ', '_')
-                index = atom.GetIdx()
                 data['SolventParameters'][topology.molecule.tag][name] = \
-                    {'radius': round(radii[tuple((index, ))]
-                                     .value_in_unit(unit.angstrom), 5),
-                     'scale': round(scales[tuple((index, ))], 5)}
+                    {'radius': round(radius.value_in_unit(unit.angstrom), 5),
+                     'scale': round(scale, 5)}
         return data
 
     def to_file(self, path):
@@ -340,6 +353,7 @@ class OBC1(_OpenFFCompatibleSolvent):
 
     _ff_file = get_data_file_path('forcefields/GBSA_OBC1-1.0.offxml')
     _name = 'OBC1'
+    _warning_issued = False
 
     def __init__(self, topologies):
         """
@@ -351,9 +365,11 @@ def __init__(self, topologies):
             The molecular topology representation to write as a
             Impact template
         """
-        # Not implemented in PELE
-        logger = Logger()
-        logger.warning('OBC1 is not implemented in PELE')
+        # Not implemented in PELE, warn only the first time
+        if not OBC1._warning_issued:
+            logger = Logger()
+            logger.warning('OBC1 is not implemented in PELE')
+            OBC1._warning_issued = True
 
         super().__init__(topologies)
 
@@ -7,7 +7,7 @@
 from peleffy.utils import get_data_file_path, temporary_cd
 from peleffy.topology import Molecule, Topology
 from peleffy.forcefield import OPLS2005ForceField, OpenForceField
-from peleffy.solvent import OPLSOBC, OBC2
+from peleffy.solvent import OPLSOBC, OBC1, OBC2
 
 
 class TestSolvent(object):
@@ -47,6 +47,47 @@ def test_single_topology(self):
         # Compare the output parameters dict with the reference parameters
         compare_dicts(reference_dict, solvent_dict)
 
+    def test_OBC1_warning(self):
+        """
+        It tests that the warning about OBC1 not being implemented in
+        PELE is only issued once, regardless of the number of OBC1
+        objects that are created.
+        """
+        import io
+        import logging
+        from peleffy.utils import Logger
+
+        # Loads the  molecule
+        molecule = Molecule(path=get_data_file_path('ligands/malonate.pdb'),
+                            tag='MAL')
+
+        # Sets forcefield and parameterizes it
+        ff = OpenForceField('openff_unconstrained-1.2.1.offxml')
+        parameters = ff.parameterize(molecule, charge_method='gasteiger')
+
+        # Initializes topology
+        topology = Topology(molecule, parameters)
+
+        # Make sure no previous OBC1 object has already issued the warning
+        OBC1._warning_issued = False
+
+        log = Logger()
+        log.set_level('WARNING')
+
+        # Catch logger messages to string buffer
+        with io.StringIO() as buf:
+            log_handler = logging.StreamHandler(buf)
+            log._logger.handlers = list()
+            log._logger.addHandler(log_handler)
+
+            _ = OBC1(topology)
+            _ = OBC1(topology)
+
+            output = buf.getvalue()
+
+            assert output == 'OBC1 is not implemented in PELE\n', \
+                'The OBC1 warning should be issued exactly once'
+
     def test_multiple_topologies(self):
         """
         It tests the class that generates a OpenFFCompatibleSolvent object for
@@ -11,6 +11,8 @@ class _TopologyElement(object):
     A wrapper for any topological element.
     """
 
+    __slots__ = ()
+
     _name = None
     _writable_attrs = []
 
@@ -124,6 +126,13 @@ class Atom(_TopologyElement):
     It represents the properties of an atom.
     """
 
+    # Atoms are created in large numbers, so their attributes are stored
+    # in slots instead of in a per-instance dict
+    __slots__ = ('_index', '_core', '_OPLS_type', '_PDB_name', '_unknown',
+                 '_x', '_y', '_z', '_sigma', '_epsilon', '_charge',
+                 '_born_radius', '_SASA_radius', '_nonpolar_gamma',
+                 '_nonpolar_alpha', '_parent')
+
     _name = 'Atom'
     _writable_attrs = ['index', 'PDB_name', 'OPLS_type']
 
@@ -529,6 +538,8 @@ class DummyAtom(Atom):
     It represents a dummy atom.
     """
 
+    __slots__ = ()
+
     def __init__(self, index=-1, PDB_name='DUMM', parent=None):
         """
         It initializes a DummyAtom object.
@@ -553,6 +564,9 @@ class Bond(_TopologyElement):
     It represents a bond in the topology.
     """
 
+    __slots__ = ('_index', '_atom1_idx', '_atom2_idx', '_spring_constant',
+                 '_eq_dist')
+
     _name = 'Bond'
     _writable_attrs = ['atom1_idx', 'atom2_idx', 'spring_constant', 'eq_dist']
 
@@ -668,6 +682,9 @@ class Angle(_TopologyElement):
     It represents an angle in the topology.
     """
 
+    __slots__ = ('_index', '_atom1_idx', '_atom2_idx', '_atom3_idx',
+                 '_spring_constant', '_eq_angle')
+
     _name = 'Angle'
     _writable_attrs = ['atom1_idx', 'atom2_idx', 'atom3_idx',
                        'spring_constant', 'eq_angle']
@@ -812,6 +829,10 @@ class Dihedral(_TopologyElement):
     It can be a proper or an improper dihedral.
     """
 
+    __slots__ = ('_index', '_atom1_idx', '_atom2_idx', '_atom3_idx',
+                 '_atom4_idx', '_periodicity', '_prefactor', '_constant',
+                 '_phase')
+
     _name = 'Dihedral'
 
     def __init__(self, index=-1, atom1_idx=None, atom2_idx=None,
@@ -1024,11 +1045,47 @@ class Proper(Dihedral):
     It represents a proper dihedral in the topology.
     """
 
+    __slots__ = ('exclude', )
+
     _name = 'Proper'
-    exclude = False
     _writable_attrs = ['atom1_idx', 'atom2_idx', 'atom3_idx', 'atom4_idx',
                        'constant', 'prefactor', 'periodicity', 'phase']
 
+    def __init__(self, index=-1, atom1_idx=None, atom2_idx=None,
+                 atom3_idx=None, atom4_idx=None, periodicity=None,
+                 prefactor=None, constant=None, phase=None):
+        """
+        It initiates a Proper object. By default, it is included in
+        PELE's 1-4 list.
+
+        Parameters
+        ----------
+        index : int
+            The index of this Proper object
+        atom1_idx : int
+            The index of the first atom involved in this Proper
+        atom2_idx : int
+            The index of the second atom involved in this Proper
+        atom3_idx : int
+            The index of the third atom involved in this Proper
+        atom4_idx : int
+            The index of the fourth atom involved in this Proper
+        periodicity : int
+            The periodicity of this Proper
+        prefactor : int
+            The prefactor of this Proper
+        constant : simtk.unit.Quantity
+            The constant of this Proper
+        phase : simtk.unit.Quantity
+            The phase constant of this Proper
+        """
+        super().__init__(index=index, atom1_idx=atom1_idx,
+                         atom2_idx=atom2_idx, atom3_idx=atom3_idx,
+                         atom4_idx=atom4_idx, periodicity=periodicity,
+                         prefactor=prefactor, constant=constant, phase=phase)
+
+        self.exclude = False
+
     def include_in_14_list(self):
         """
         It includes this proper dihedral in PELE's 1-4 list.
@@ -1048,6 +1105,8 @@ class Improper(Dihedral):
     It represents an improper dihedral in the topology.
     """
 
+    __slots__ = ()
+
     _name = 'Improper'
     _writable_attrs = ['atom1_idx', 'atom2_idx', 'atom3_idx', 'atom4_idx',
                        'constant', 'prefactor', 'periodicity']
@@ -1058,10 +1117,14 @@ class OFFDihedral(_TopologyElement):
     It represents a dihedral in the Open Force Field's topology.
     """
 
+    __slots__ = ('index', 'atom1_idx', 'atom2_idx', 'atom3_idx', 'atom4_idx',
+                 'periodicity', 'phase', 'k', 'idivf')
+
     _name = 'OFFDihedral'
     _writable_attrs = ['atom1_idx', 'atom2_idx', 'atom3_idx', 'atom4_idx',
                        'periodicity', 'phase', 'k', 'idivf']
     _to_PELE_class = Dihedral
+    _PELE_null_phase = unit.Quantity(value=0.0, unit=unit.degree)
 
     def __init__(self, index=-1, atom1_idx=None, atom2_idx=None,
                  atom3_idx=None, atom4_idx=None, periodicity=None,
@@ -1134,13 +1197,14 @@ def to_PELE(self):
         except AssertionError as e:
             raise ValueError('Invalid value found: {}'.format(e))
 
-        PELE_phase = self.phase
-
+        # A 180-degree phase is expressed in PELE with a negative prefactor
+        # and a null phase, which is shared by all dihedrals
         if self.phase.value_in_unit(unit.degree) == 180:
             PELE_prefactor = -1
-            PELE_phase = unit.Quantity(value=0.0, unit=unit.degree)
+            PELE_phase = self._PELE_null_phase
         else:
             PELE_prefactor = 1
+            PELE_phase = self.phase
 
         PELE_constant = self.k / self.idivf
 
@@ -1176,6 +1240,8 @@ class OFFProper(OFFDihedral):
     It represents a proper dihedral in the Open Force Field's topology.
     """
 
+    __slots__ = ()
+
     _name = 'OFFProper'
     _to_PELE_class = Proper
 
@@ -1213,6 +1279,8 @@ class OFFImproper(OFFDihedral):
     It represents an improper dihedral in the Open Force Field's topology.
     """
 
+    __slots__ = ()
+
     _name = 'OFFImproper'
     _to_PELE_class = Improper
 
@@ -158,6 +158,7 @@ def _initialize(self):
         self._off_molecule = None
         self._rotamers = None
         self._graph = None
+        self._pdb_atom_names = None
 
     def _pdb_checkup(self, path):
         """
@@ -457,15 +458,19 @@ def set_tag(self, tag):
     def get_pdb_atom_names(self):
         """
         It returns the PDB atom names of all the atoms in the molecule.
+        They are obtained from the RDKit molecule the first time they
+        are requested and cached afterwards.
 
         Returns
         -------
         pdb_atom_names : list[str]
             The PDB atom names of all the atoms in this Molecule object
         """
-        rdkit_toolkit = RDKitToolkitWrapper()
+        if self._pdb_atom_names is None:
+            rdkit_toolkit = RDKitToolkitWrapper()
+            self._pdb_atom_names = rdkit_toolkit.get_atom_names(self)
 
-        return rdkit_toolkit.get_atom_names(self)
+        return list(self._pdb_atom_names)
 
     def to_pdb_file(self, path):
         """
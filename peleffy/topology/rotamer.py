@@ -369,7 +369,7 @@ def get_all_nrot_neighbors(self, atom_id, visited_neighbors):
                                 reverse=True)[0]
 
             for neighbor in neighbor_candidates:
-                if any([neighbor in rot_bond for rot_bond in best_group]):
+                if any(neighbor in rot_bond for rot_bond in best_group):
                     deepest_neighbor = neighbor
                     break
             else:
@@ -3,6 +3,8 @@
 """
 
 
+from collections import defaultdict
+
 from peleffy.topology.elements import (Atom, Bond, Angle,
                                        OFFProper, OFFImproper)
 from peleffy.utils.toolkits import RDKitToolkitWrapper
@@ -85,7 +87,7 @@ def _build(self):
 
         # In case the molecule has not been initialized
         if (self.molecule.rdkit_molecule is None
-                or len(list(self.parameters.atom_iterator)) == 0):
+                or len(self.parameters['atom_names']) == 0):
             logger = Logger()
             logger.warning('Warning: the input molecule has not been '
                            + ' initialized and its topology will be empty')
@@ -103,17 +105,25 @@ def _build_atoms(self):
         from peleffy.utils import Logger
         logger = Logger()
 
-        coords = RDKitToolkitWrapper().get_coordinates(self.molecule)
+        # Convert the coordinates array to plain floats in a single call,
+        # instead of indexing the numpy array atom by atom
+        coords = RDKitToolkitWrapper().get_coordinates(self.molecule).tolist()
+
+        # zip() stops silently at the shortest iterable, so make sure that
+        # there is one set of coordinates per parameterized atom
+        assert len(coords) == len(self.parameters['atom_names']), \
+            'The number of coordinates does not match the number of ' \
+            'parameterized atoms'
 
-        for index, (atom_name, atom_type, sigma, epsilon, charge,
-                    SGB_radius, vdW_radius, gamma, alpha) \
-                in enumerate(self.parameters.atom_iterator):
+        for index, ((x, y, z), (atom_name, atom_type, sigma, epsilon, charge,
+                                SGB_radius, vdW_radius, gamma, alpha)) \
+                in enumerate(zip(coords, self.parameters.atom_iterator)):
             atom = Atom(index=index,
                         PDB_name=atom_name,
                         OPLS_type=atom_type,
-                        x=coords[index][0],
-                        y=coords[index][1],
-                        z=coords[index][2],
+                        x=x,
+                        y=y,
+                        z=z,
                         sigma=sigma,
                         epsilon=epsilon,
                         charge=charge,
@@ -154,40 +164,40 @@ def _build_atoms(self):
 
     def _build_bonds(self):
         """It builds the bonds of the molecule."""
-        for index, bond in enumerate(self.parameters['bonds']):
-            bond = Bond(index=index,
-                        atom1_idx=bond['atom1_idx'],
-                        atom2_idx=bond['atom2_idx'],
-                        spring_constant=bond['spring_constant'],
-                        eq_dist=bond['eq_dist'])
-            self.add_bond(bond)
+        self._bonds.extend(
+            Bond(index=index,
+                 atom1_idx=bond['atom1_idx'],
+                 atom2_idx=bond['atom2_idx'],
+                 spring_constant=bond['spring_constant'],
+                 eq_dist=bond['eq_dist'])
+            for index, bond in enumerate(self.parameters['bonds']))
 
     def _build_angles(self):
         """It builds the angles of the molecule."""
-        for index, angle in enumerate(self.parameters['angles']):
-            angle = Angle(index=index,
-                          atom1_idx=angle['atom1_idx'],
-                          atom2_idx=angle['atom2_idx'],
-                          atom3_idx=angle['atom3_idx'],
-                          spring_constant=angle['spring_constant'],
-                          eq_angle=angle['eq_angle'])
-            self.add_angle(angle)
+        self._angles.extend(
+            Angle(index=index,
+                  atom1_idx=angle['atom1_idx'],
+                  atom2_idx=angle['atom2_idx'],
+                  atom3_idx=angle['atom3_idx'],
+                  spring_constant=angle['spring_constant'],
+                  eq_angle=angle['eq_angle'])
+            for index, angle in enumerate(self.parameters['angles']))
 
     def _build_propers(self):
         """It builds the propers of the molecule."""
-        for index, proper in enumerate(self.parameters['propers']):
-            off_proper = OFFProper(atom1_idx=proper['atom1_idx'],
-                                   atom2_idx=proper['atom2_idx'],
-                                   atom3_idx=proper['atom3_idx'],
-                                   atom4_idx=proper['atom4_idx'],
-                                   periodicity=proper['periodicity'],
-                                   phase=proper['phase'],
-                                   k=proper['k'],
-                                   idivf=proper['idivf'])
-
-            PELE_proper = off_proper.to_PELE()
-            self.add_proper(PELE_proper)
-            self.add_OFF_proper(off_proper)
+        off_propers = [OFFProper(atom1_idx=proper['atom1_idx'],
+                                 atom2_idx=proper['atom2_idx'],
+                                 atom3_idx=proper['atom3_idx'],
+                                 atom4_idx=proper['atom4_idx'],
+                                 periodicity=proper['periodicity'],
+                                 phase=proper['phase'],
+                                 k=proper['k'],
+                                 idivf=proper['idivf'])
+                       for proper in self.parameters['propers']]
+
+        self._OFF_propers.extend(off_propers)
+        self._propers.extend(off_proper.to_PELE()
+                             for off_proper in off_propers)
 
         self._handle_excluded_propers()
 
@@ -195,69 +205,51 @@ def _handle_excluded_propers(self):
         """
         It looks for those propers that define duplicated 1-4 relations
         and sets them to be ignored in PELE's 1-4 list.
+
+        Bonds, angles and propers are walked only once. Their terminal
+        atoms are gathered as unordered pairs, so each proper is checked
+        with set lookups instead of being compared against every other
+        element of the topology.
         """
-        for i, proper in enumerate(self.propers):
-            atom1_idx = proper.atom1_idx
-            atom4_idx = proper.atom4_idx
-            for proper_to_compare in self.propers[0:i]:
-                if proper == proper_to_compare:
-                    continue
-
-                if proper_to_compare.atom3_idx < 0:
-                    continue
-
-                # PELE already ignores 1-4 pair when the proper is exactly
-                # the same
-                if (proper.atom1_idx == proper_to_compare.atom1_idx
-                        and proper.atom2_idx == proper_to_compare.atom2_idx
-                        and proper.atom3_idx == proper_to_compare.atom3_idx
-                        and proper.atom4_idx == proper_to_compare.atom4_idx):
-                    continue
-
-                atom1_idx_to_compare = proper_to_compare.atom1_idx
-                atom4_idx_to_compare = proper_to_compare.atom4_idx
-                if (atom1_idx == atom1_idx_to_compare
-                        and atom4_idx == atom4_idx_to_compare):
-                    proper.exclude_from_14_list()
-                elif (atom1_idx == atom4_idx_to_compare
-                        and atom4_idx == atom1_idx_to_compare):
-                    proper.exclude_from_14_list()
-
-            for angle_to_compare in self.angles:
-                atom1_idx_to_compare = angle_to_compare.atom1_idx
-                atom4_idx_to_compare = angle_to_compare.atom3_idx
-                if (atom1_idx == atom1_idx_to_compare
-                        and atom4_idx == atom4_idx_to_compare):
-                    proper.exclude_from_14_list()
-                elif (atom1_idx == atom4_idx_to_compare
-                        and atom4_idx == atom1_idx_to_compare):
-                    proper.exclude_from_14_list()
-
-            for bond_to_compare in self.bonds:
-                atom1_idx_to_compare = bond_to_compare.atom1_idx
-                atom4_idx_to_compare = bond_to_compare.atom2_idx
-                if (atom1_idx == atom1_idx_to_compare
-                        and atom4_idx == atom4_idx_to_compare):
-                    proper.exclude_from_14_list()
-                elif (atom1_idx == atom4_idx_to_compare
-                        and atom4_idx == atom1_idx_to_compare):
-                    proper.exclude_from_14_list()
+        # Terminal atoms of bonds and angles
+        bonded_pairs = set()
+        for bond in self.bonds:
+            bonded_pairs.add(frozenset((bond.atom1_idx, bond.atom2_idx)))
+        for angle in self.angles:
+            bonded_pairs.add(frozenset((angle.atom1_idx, angle.atom3_idx)))
+
+        # Atom indexes of the previous propers, grouped by terminal atoms
+        previous_propers = defaultdict(set)
+
+        for proper in self.propers:
+            pair = frozenset((proper.atom1_idx, proper.atom4_idx))
+            atom_idxs = (proper.atom1_idx, proper.atom2_idx,
+                         proper.atom3_idx, proper.atom4_idx)
+
+            # Previous propers with exactly the same atoms are not taken
+            # into account, PELE already ignores their 1-4 pair
+            if (pair in bonded_pairs
+                    or len(previous_propers[pair] - {atom_idxs}) > 0):
+                proper.exclude_from_14_list()
+
+            if proper.atom3_idx >= 0:
+                previous_propers[pair].add(atom_idxs)
 
     def _build_impropers(self):
         """It builds the impropers of the molecule."""
-        for index, improper in enumerate(self.parameters['impropers']):
-            off_improper = OFFImproper(atom1_idx=improper['atom1_idx'],
-                                       atom2_idx=improper['atom2_idx'],
-                                       atom3_idx=improper['atom3_idx'],
-                                       atom4_idx=improper['atom4_idx'],
-                                       periodicity=improper['periodicity'],
-                                       phase=improper['phase'],
-                                       k=improper['k'],
-                                       idivf=improper['idivf'])
-
-            PELE_improper = off_improper.to_PELE()
-            self.add_improper(PELE_improper)
-            self.add_OFF_improper(off_improper)
+        off_impropers = [OFFImproper(atom1_idx=improper['atom1_idx'],
+                                     atom2_idx=improper['atom2_idx'],
+                                     atom3_idx=improper['atom3_idx'],
+                                     atom4_idx=improper['atom4_idx'],
+                                     periodicity=improper['periodicity'],
+                                     phase=improper['phase'],
+                                     k=improper['k'],
+                                     idivf=improper['idivf'])
+                         for improper in self.parameters['impropers']]
+
+        self._OFF_impropers.extend(off_impropers)
+        self._impropers.extend(off_improper.to_PELE()
+                               for off_improper in off_impropers)
 
     def add_atom(self, atom):
         """
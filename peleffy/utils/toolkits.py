@@ -85,18 +85,22 @@ def __init__(self):
     @staticmethod
     def is_available():
         """
-        Check whether the RDKit toolkit can be imported
+        Check whether the RDKit toolkit can be imported. The result is
+        cached after the first check.
 
         Returns
         -------
         is_installed : bool
             True if RDKit is installed, False otherwise.
         """
-        try:
-            importlib.import_module('rdkit', 'Chem')
-            return True
-        except ImportError:
-            return False
+        if RDKitToolkitWrapper._is_available is None:
+            try:
+                importlib.import_module('rdkit', 'Chem')
+                RDKitToolkitWrapper._is_available = True
+            except ImportError:
+                RDKitToolkitWrapper._is_available = False
+
+        return RDKitToolkitWrapper._is_available
 
     def from_pdb(self, path):
         """
@@ -235,7 +239,7 @@ def get_residue_name(self, molecule):
         """
         rdkit_molecule = molecule.rdkit_molecule
 
-        first_atom = list(rdkit_molecule.GetAtoms())[0]
+        first_atom = rdkit_molecule.GetAtomWithIdx(0)
 
         # Catch a None return
         try:
@@ -348,12 +352,7 @@ def get_atom_degrees(self, molecule):
         """
         rdkit_molecule = molecule.rdkit_molecule
 
-        atom_degrees = list()
-
-        for atom in rdkit_molecule.GetAtoms():
-            atom_degrees.append(atom.GetDegree())
-
-        return atom_degrees
+        return [atom.GetDegree() for atom in rdkit_molecule.GetAtoms()]
 
     def get_hydrogen_parents(self, molecule):
         """
@@ -413,12 +412,7 @@ def get_elements(self, molecule):
         """
         rdkit_molecule = molecule.rdkit_molecule
 
-        elements = list()
-
-        for atom in rdkit_molecule.GetAtoms():
-            elements.append(atom.GetSymbol())
-
-        return elements
+        return [atom.GetSymbol() for atom in rdkit_molecule.GetAtoms()]
 
     def to_pdb_file(self, molecule, path):
         """
@@ -774,18 +768,22 @@ def __init__(self):
     @staticmethod
     def is_available():
         """
-        Check whether the OpenForceField toolkit is installed
+        Check whether the OpenForceField toolkit is installed. The result
+        is cached after the first check.
 
         Returns
         -------
         is_installed : bool
             True if OpenForceField is installed, False otherwise.
         """
-        try:
-            importlib.import_module('openforcefield')
-            return True
-        except ImportError:
-            return False
+        if OpenForceFieldToolkitWrapper._is_available is None:
+            try:
+                importlib.import_module('openforcefield')
+                OpenForceFieldToolkitWrapper._is_available = True
+            except ImportError:
+                OpenForceFieldToolkitWrapper._is_available = False
+
+        return OpenForceFieldToolkitWrapper._is_available
 
     def from_rdkit(self, molecule):
         """